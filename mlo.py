@@ -9,17 +9,80 @@ Other capabilities retained from mlo.py:
 - Output can be "pretty" (default) or JSON (machine-readable) via --output json.
 """
 import argparse
+import io
 import json
+import mmap
+import os
+import re
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache, partial
+from itertools import accumulate, compress, filterfalse
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Iterable, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Iterable, Union
+
+try:
+    import ahocorasick  # optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # optional: pip install orjson
+except ImportError:
+    orjson = None
 
 JSONScalar = Union[str, int, float, bool, None]
+# texts -> [(index into texts, matched terms)] for the texts that matched
+Matcher = Callable[[List[str]], List[Tuple[int, List[str]]]]
+
+# Below this many files the process pool costs more than it saves.
+MIN_PARALLEL_FILES = 4
+
+# Threads listing directories in parallel (scandir releases the GIL while it waits on I/O).
+SCAN_THREADS = 16
+
+# search_json hands strings to the matcher in batches of about this many characters,
+# joined by BATCH_SEPARATOR so a term can't match across two strings. Each separator
+# counts too, so runs of empty strings still fill a batch.
+BATCH_CHARS = 64 * 1024
+BATCH_SEPARATOR = "\x1f"
+
+# Up to this many keys, substring tests (first on the joined batch, then per string for the
+# terms it contains) beat an automaton or regex scan of the batch.
+MATCH_EACH_MAX_KEYS = 4
+
+# Pre-parse checks scan the raw file this many bytes at a time.
+SHORTLIST_WINDOW = 1 << 20
+
+# Without pyahocorasick the pre-parse check costs one scan of the file per key,
+# so it is skipped for more keys than this.
+SHORTLIST_MAX_FIND_KEYS = 16
+
+# Distinct strings whose match results are remembered per document before the cache is reset.
+MATCH_CACHE_SIZE = 65536
+
+_INF = float("inf")
+
+# orjson doesn't reject integers outside the 64-bit range, it quietly returns floats
+# (100000000000000000000 -> 1e+20). Those need 19+ digits (-9223372036854775809),
+# so buffers with such a digit run are parsed by json instead.
+_LONG_DIGITS = re.compile(rb"\d{19}")
+_LONG_DIGITS_STR = re.compile(r"\d{19}")
+
+# bytes.translate table lowercasing A-Z only
+_ASCII_LOWER = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
+# Every character a stringified number can contain (see scalar_to_str), in either case.
+_NUMBER_CHARS = frozenset("0123456789+-.eNaNInfinity" + "naninfinity")
 
 def load_keys_from_file(path: Path) -> List[str]:
     text = path.read_text(encoding="utf-8").strip()
     # Try JSON first (e.g., ["alpha","beta"])
     try:
-        data = json.loads(text)
+        data = _loads(text)
         if isinstance(data, list) and all(isinstance(x, str) for x in data):
             return [x.strip() for x in data if x.strip()]
     except json.JSONDecodeError:
@@ -44,76 +107,583 @@ def normalize_terms(terms: Iterable[str], case_sensitive: bool) -> List[str]:
             unique.append(t)
     return unique
 
-def iter_json_files(root: Path, extensions: Iterable[str]) -> Iterable[Path]:
+def _scan_dir(directory: str, endings: Tuple[str, ...]) -> Tuple[List[str], List[str]]:
+    # One directory level: (matching files, subdirectories). Unreadable dirs are skipped.
+    files: List[str] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    name = entry.name.lower()
+                    # A name that is just the ending (".json") is a dotfile with no extension.
+                    if name.endswith(endings) and name not in endings and entry.is_file():
+                        files.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+def iter_json_files(root: Path, extensions: Iterable[str]) -> Iterable[str]:
+    """
+    Yields paths of files under root whose extension is in extensions (root itself if it's a file).
+    Directories are listed by a thread pool; each finished listing queues its subdirectories,
+    and files are yielded as listings complete (not in any particular order).
+    """
     if root.is_file():
-        yield root
+        yield str(root)
         return
-    exts = {e.lower().lstrip(".") for e in extensions}
-    for p in root.rglob("*"):
-        if p.is_file() and p.suffix.lower().lstrip(".") in exts:
-            yield p
+    # e.g. (".json", ".geojson"); str.endswith takes the whole tuple in one call
+    endings = tuple(f".{e.lower().lstrip('.')}" for e in extensions if e.lstrip("."))
+    with ThreadPoolExecutor(max_workers=SCAN_THREADS) as ex:
+        pending = {ex.submit(_scan_dir, str(root), endings)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                files, subdirs = fut.result()
+                for d in subdirs:
+                    pending.add(ex.submit(_scan_dir, d, endings))
+                yield from files
 
 def scalar_to_str(value: JSONScalar) -> str:
-    # For matching, stringify scalars
-    if isinstance(value, str):
+    # For matching, stringify scalars the way json.dumps would, without calling it
+    t = type(value)
+    if t is str:
         return value
+    if t is bool:
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if t is int:
+        return repr(value)
+    if t is float:
+        if value != value:
+            return "NaN"
+        if value in (_INF, -_INF):
+            return "Infinity" if value > 0 else "-Infinity"
+        return repr(value)
     return json.dumps(value, ensure_ascii=False)
 
+def build_matcher(keys: List[str]) -> Matcher:
+    """
+    Returns a function that takes a batch of normalized strings and reports,
+    for each string that matched, the terms it contains (each term once, in the order of keys).
+    The batch is joined into one buffer and scanned in one pass:
+    - with a single Aho-Corasick automaton when pyahocorasick is installed;
+    - otherwise with one compiled regex alternation that finds the strings containing
+      any term, which are then checked term by term.
+    Up to MATCH_EACH_MAX_KEYS keys (or keys containing BATCH_SEPARATOR) use plain substring tests.
+    """
+    def match_each(texts: List[str]) -> List[Tuple[int, List[str]]]:
+        # A term absent from the whole batch can't be in any one string.
+        joined = BATCH_SEPARATOR.join(texts)
+        present = [term for term in keys if term in joined]
+        out = []
+        if present:
+            for i, text in enumerate(texts):
+                terms = [term for term in present if term in text]
+                if terms:
+                    out.append((i, terms))
+        return out
+
+    if (not keys or len(keys) <= MATCH_EACH_MAX_KEYS
+            or any(BATCH_SEPARATOR in k for k in keys)):
+        return match_each
+
+    if ahocorasick is None:
+        # Longest first so the longest alternative wins at a given offset.
+        pattern = re.compile("|".join(sorted(map(re.escape, keys), key=len, reverse=True)))
+
+        def match_regex(texts: List[str]) -> List[Tuple[int, List[str]]]:
+            # ends[i] is the offset just past texts[i] and its separator
+            ends = list(accumulate(len(t) + 1 for t in texts))
+            out = []
+            last = -1
+            for m in pattern.finditer(BATCH_SEPARATOR.join(texts)):
+                i = bisect_right(ends, m.start())
+                if i != last:
+                    # finditer doesn't report overlapping terms, so confirm each one.
+                    text = texts[i]
+                    out.append((i, [term for term in keys if term in text]))
+                    last = i
+            return out
+        return match_regex
+
+    automaton = ahocorasick.Automaton()
+    for k in keys:
+        automaton.add_word(k, k)
+    automaton.make_automaton()
+    rank = {k: i for i, k in enumerate(keys)}.__getitem__
+
+    def match_automaton(texts: List[str]) -> List[Tuple[int, List[str]]]:
+        # ends[i] is the offset just past texts[i] and its separator
+        ends = list(accumulate(len(t) + 1 for t in texts))
+        out: List[Tuple[int, List[str]]] = []
+        last = -1
+        # Hits come in order of end offset, so each string's hits are consecutive.
+        for end, term in automaton.iter(BATCH_SEPARATOR.join(texts)):
+            i = bisect_right(ends, end)
+            if i != last:
+                terms = [term]
+                out.append((i, terms))
+                last = i
+            elif term not in terms:
+                terms.append(term)
+        for _i, terms in out:
+            if len(terms) > 1:
+                terms.sort(key=rank)
+        return out
+    return match_automaton
+
+def escape_pointer_segment(segment: Union[str, int]) -> str:
+    # RFC 6901: "~" -> "~0", "/" -> "~1" (in that order)
+    s = str(segment)
+    if "~" in s or "/" in s:
+        s = s.replace("~", "~0").replace("/", "~1")
+    return s
+
+def _match_pending(match: Matcher,
+                   texts: List[str],
+                   locs: List[Tuple[Any, Any]],
+                   hits: List[Tuple[Sequence[str], Tuple[Any, Any]]],
+                   cache: Dict[str, Sequence[str]]) -> None:
+    # Runs the matcher over the queued strings, records a (terms, loc) hit for each string
+    # that matched and empties the queue.
+    # Repeated strings (enum-like values, recurring keys) are matched once and then answered
+    # from cache, which is reset once it holds MATCH_CACHE_SIZE strings.
+    if len(cache) >= MATCH_CACHE_SIZE:
+        cache.clear()
+    fresh = list(filterfalse(cache.__contains__, dict.fromkeys(texts)))
+    if fresh:
+        cache.update(dict.fromkeys(fresh, ()))
+        for i, terms in match(fresh):
+            # A tuple of str (not a list) lets the GC untrack every stored hit; with
+            # hundreds of thousands of hits, tracked ones set off full collections
+            # that rescan the whole parsed document.
+            cache[fresh[i]] = tuple(terms)
+    get = cache.get
+    matched = list(compress(range(len(texts)), map(get, texts)))
+    if matched:
+        hits.extend(zip(map(get, map(texts.__getitem__, matched)), map(locs.__getitem__, matched)))
+    texts.clear()
+    locs.clear()
+
+# Source of the traversal behind search_json. _walker fills in the mode-dependent
+# blocks once per (case_sensitive, keys_only, values_only), so the hot loop carries
+# no flag checks at all.
+_WALK_TEMPLATE = """
+def walk(obj, match, hits, nodes):
+    isinstance_ = isinstance
+    str_ = str
+    nodes_append = nodes.append
+
+    # Strings waiting to be matched, and the (parent node id, segment) each came from.
+    texts = []
+    locs = []
+    texts_append = texts.append
+    locs_append = locs.append
+    pending = 0
+    # normalized string -> terms it contains; strings known not to match aren't queued
+    cache = {{}}
+    cache_get = cache.get
+
+    # Open containers as (iterator over (segment, child), node id), innermost last.
+    # Scalars are checked as their container is iterated and only containers are pushed,
+    # so matches are still reported in document order.
+    stack = [(iter(((None, obj),)), None)]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        it, parent = stack[-1]
+        for seg, cur in it:
+            if pending >= BATCH_CHARS:
+                _match_pending(match, texts, locs, hits, cache)
+                pending = 0
+{key_check}
+            if isinstance_(cur, dict):
+                nid = len(nodes)
+                nodes_append((parent, seg))
+                push((iter(cur.items()), nid))
+                break
+            if isinstance_(cur, list):
+                nid = len(nodes)
+                nodes_append((parent, seg))
+                push((enumerate(cur), nid))
+                break
+{value_check}
+        else:
+            pop()
+    _match_pending(match, texts, locs, hits, cache)
+"""
+
+_WALK_KEY_CHECK = """
+            if seg.__class__ is str_:
+                nk = seg{lower}
+                if cache_get(nk, True):
+                    texts_append(nk)
+                    locs_append((parent, seg))
+                    pending += len(nk) + 1
+"""
+
+# keys-only doesn't descend into dict values (their own keys aren't checked)
+_WALK_SKIP_DICT_VALUES = """
+                continue
+"""
+
+_WALK_VALUE_CHECK = """
+            nv = (cur if cur.__class__ is str_ else scalar_to_str(cur)){lower}
+            if cache_get(nv, True):
+                texts_append(nv)
+                locs_append((parent, seg))
+                pending += len(nv) + 1
+"""
+
+@lru_cache(maxsize=None)
+def _walker(case_sensitive: bool,
+            keys_only: bool,
+            values_only: bool) -> Callable[[Any, Matcher, List[Any], List[Any]], None]:
+    # Generates (and caches) the traversal specialized for one combination of mode flags.
+    lower = "" if case_sensitive else ".lower()"
+    key_check = "" if values_only else _WALK_KEY_CHECK.strip("\n").format(lower=lower)
+    if keys_only:
+        key_check += _WALK_SKIP_DICT_VALUES.rstrip("\n")
+    src = _WALK_TEMPLATE.format(
+        key_check=key_check,
+        value_check="" if keys_only else _WALK_VALUE_CHECK.strip("\n").format(lower=lower),
+    )
+    ns: Dict[str, Any] = {}
+    exec(compile(src, f"<mlo walk cs={case_sensitive} ko={keys_only} vo={values_only}>", "exec"), globals(), ns)
+    return ns["walk"]
+
 def search_json(obj: Any,
-                keys: List[str],
+                match: Matcher,
                 case_sensitive: bool,
                 keys_only: bool,
                 values_only: bool,
-                path: str = "") -> List[Tuple[str, str]]:
+                path: str = "") -> Dict[str, List[str]]:
     """
-    Returns list of (matched_term, json_pointer_path) for each match found in obj.
+    Returns {matched_term: [json_pointer_path, ...]} for the matches found in obj,
+    terms in order of first match and paths in document order.
+    - match: term matcher built from the normalized keys (see build_matcher).
     - If keys_only: only check dict keys.
     - If values_only: only check values (scalars become strings before matching).
     - If neither flag is set: check both keys and values.
+    Walks obj with an explicit stack, so deeply nested documents can't hit the recursion limit.
+    Pointers are only built for matches, with segments escaped per RFC 6901.
     """
-    matches: List[Tuple[str, str]] = []
+    # Containers seen so far, as (parent node id, segment); the root's parent is None.
+    nodes: List[Tuple[Optional[int], Union[str, int, None]]] = []
+    # Raw hits as (terms, (parent node id, segment)); a str segment is a dict key.
+    hits: List[Tuple[Sequence[str], Tuple[Optional[int], Union[str, int, None]]]] = []
+    _walker(case_sensitive, keys_only, values_only)(obj, match, hits, nodes)
 
-    def norm(s: str) -> str:
-        return s if case_sensitive else s.lower()
+    prefixes: Dict[int, str] = {}
 
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            kp = f"{path}/{k}"
+    def prefix(nid: Optional[int]) -> str:
+        # Walk up to the nearest cached ancestor, then fill the cache back down.
+        chain = []
+        while nid is not None and nid not in prefixes:
+            chain.append(nid)
+            nid = nodes[nid][0]
+        p = path if nid is None else prefixes[nid]
+        for cid in reversed(chain):
+            parent, seg = nodes[cid]
+            p = path if parent is None else f"{p}/{escape_pointer_segment(seg)}"
+            prefixes[cid] = p
+        return p
+
+    matches: Dict[str, List[str]] = defaultdict(list)
+    str_ = str
+    last, p = None, path
+    for terms, (parent, seg) in hits:
+        if parent is None:
+            # scalar at root
+            ptr = path or "/"
+        else:
+            # Hits cluster by container, so the previous prefix is usually still right.
+            if parent != last:
+                last, p = parent, prefix(parent)
+            if seg.__class__ is str_ and "~" not in seg and "/" not in seg:
+                ptr = f"{p}/{seg}"
+            else:
+                ptr = f"{p}/{escape_pointer_segment(seg)}"
+        for term in terms:
+            matches[term].append(ptr)
+    return dict(matches)
+
+def search_json_events(events: Iterable[Tuple[str, str, Any]],
+                       match: Matcher,
+                       case_sensitive: bool,
+                       keys_only: bool,
+                       values_only: bool,
+                       path: str = "") -> Dict[str, List[str]]:
+    """
+    Like search_json, but over the (prefix, event, value) tuples of ijson.parse, so only the
+    open containers and one batch of strings are held in memory, never the whole document.
+    ijson's dotted prefixes don't carry list indices, so pointers are tracked here instead.
+    Unlike a loaded document, the events keep every copy of a duplicated object key, so each
+    copy (and everything under it) is searched; json/orjson keep only the last value.
+    """
+    str_ = str
+    # Raw hits as (terms, (parent pointer or None at the root, segment))
+    hits: List[Tuple[Sequence[str], Tuple[Optional[str], Union[str, int, None]]]] = []
+    texts: List[str] = []
+    locs: List[Tuple[Optional[str], Union[str, int, None]]] = []
+    pending = 0
+    # normalized string -> terms it contains; strings known not to match aren't queued
+    cache: Dict[str, Sequence[str]] = {}
+    cache_get = cache.get
+
+    # Open containers as [pointer, current key or last index, is_array]
+    frames: List[List[Any]] = []
+    # Depth inside a container being skipped (keys-only doesn't descend into dict values)
+    skip = 0
+    for _prefix, event, value in events:
+        if skip:
+            if event == "start_map" or event == "start_array":
+                skip += 1
+            elif event == "end_map" or event == "end_array":
+                skip -= 1
+            continue
+        if event == "map_key":
+            frame = frames[-1]
+            frame[1] = value
             if not values_only:
-                nk = norm(str(k))
-                for term in keys:
-                    if term in nk:
-                        matches.append((term, kp))
-            if not keys_only:
-                if isinstance(v, (dict, list)):
-                    matches.extend(search_json(v, keys, case_sensitive, keys_only, values_only, kp))
-                else:
-                    sval = scalar_to_str(v)
-                    nv = norm(sval)
-                    for term in keys:
-                        if term in nv:
-                            matches.append((term, kp))
-    elif isinstance(obj, list):
-        for idx, item in enumerate(obj):
-            ip = f"{path}/{idx}"
-            if isinstance(item, (dict, list)):
-                matches.extend(search_json(item, keys, case_sensitive, keys_only, values_only, ip))
+                nk = value if case_sensitive else value.lower()
+                if cache_get(nk, True):
+                    texts.append(nk)
+                    locs.append((frame[0], value))
+                    pending += len(nk) + 1
+        elif event == "end_map" or event == "end_array":
+            frames.pop()
+        else:
+            # A value; find where it sits in its parent.
+            if frames:
+                frame = frames[-1]
+                if frame[2]:
+                    frame[1] += 1
+                parent, seg = frame[0], frame[1]
             else:
-                if not keys_only:
-                    sval = scalar_to_str(item)
-                    nv = norm(sval)
-                    for term in keys:
-                        if term in nv:
-                            matches.append((term, ip))
+                parent, seg = None, None
+            if event == "start_map" or event == "start_array":
+                if keys_only and frames and not frames[-1][2]:
+                    skip = 1
+                    continue
+                ptr = path if parent is None else f"{parent}/{escape_pointer_segment(seg)}"
+                is_array = event == "start_array"
+                frames.append([ptr, -1 if is_array else None, is_array])
+            elif not keys_only:
+                nv = value if value.__class__ is str_ else scalar_to_str(value)
+                if not case_sensitive:
+                    nv = nv.lower()
+                if cache_get(nv, True):
+                    texts.append(nv)
+                    locs.append((parent, seg))
+                    pending += len(nv) + 1
+        if pending >= BATCH_CHARS:
+            _match_pending(match, texts, locs, hits, cache)
+            pending = 0
+    _match_pending(match, texts, locs, hits, cache)
+
+    matches: Dict[str, List[str]] = defaultdict(list)
+    for terms, (parent, seg) in hits:
+        # parent is None for a scalar at root
+        ptr = path or "/" if parent is None else f"{parent}/{escape_pointer_segment(seg)}"
+        for term in terms:
+            matches[term].append(ptr)
+    return dict(matches)
+
+def _loads(buf: Union[str, bytes, memoryview]) -> Any:
+    """
+    Parses JSON from a str or a UTF-8 buffer, using orjson when installed.
+    """
+    long_digits = _LONG_DIGITS_STR if isinstance(buf, str) else _LONG_DIGITS
+    if orjson is not None and long_digits.search(buf) is None:
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity; let json decide.
+            pass
+    if not isinstance(buf, str):
+        # json.loads only takes str/bytes, but str() decodes any buffer in place.
+        buf = str(buf, "utf-8")
+    return json.loads(buf)
+
+@contextmanager
+def _file_buffer(fp: str) -> Iterator[Union[bytes, mmap.mmap]]:
+    # The raw file: read whole if it's under a page, memory-mapped otherwise.
+    with open(fp, "rb") as f:
+        if os.fstat(f.fileno()).st_size < mmap.PAGESIZE:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+def _parse_buffer(buf: Union[bytes, mmap.mmap]) -> Any:
+    """
+    Parses a UTF-8 JSON buffer from _file_buffer.
+    A mapping is parsed straight from its pages, skipping the copy that read_text makes.
+    """
+    if isinstance(buf, mmap.mmap):
+        with memoryview(buf) as view:
+            return _loads(view)
+    return _loads(buf)
+
+@lru_cache(maxsize=None)
+def _raw_key_bytes(keys: Tuple[str, ...]) -> Tuple[Optional[bytes], ...]:
+    # UTF-8 form of each key for _shortlist_keys, or None for a key that could match inside
+    # a re-stringified number (e.g. "100" in 1e5 -> "100000.0") and so is never ruled out.
+    return tuple(None if _NUMBER_CHARS.issuperset(k) else k.encode("utf-8") for k in keys)
+
+def _raw_windows(buf: Union[bytes, mmap.mmap], overlap: int) -> Iterator[bytes]:
+    # Consecutive slices of about SHORTLIST_WINDOW bytes, each repeating the last `overlap`
+    # bytes of the one before, cut only on UTF-8 character boundaries.
+    size = len(buf)
+    window = max(SHORTLIST_WINDOW, 2 * overlap + 8)
+    start = 0
+    while True:
+        end = min(start + window, size)
+        while end < size and 0x80 <= buf[end] < 0xC0:
+            end -= 1
+        yield buf[start:end]
+        if end >= size:
+            return
+        start = end - overlap
+        while 0x80 <= buf[start] < 0xC0:
+            start -= 1
+
+def _lower_raw(chunk: bytes) -> Optional[bytes]:
+    # ASCII goes through the translate table; anything else through str.lower (which also
+    # folds non-ASCII letters). None if the chunk isn't valid UTF-8.
+    if chunk.isascii():
+        return chunk.translate(_ASCII_LOWER)
+    try:
+        return str(chunk, "utf-8").lower().encode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+@lru_cache(maxsize=64)
+def _raw_automaton(key_bytes: Tuple[bytes, ...]) -> Any:
+    # Aho-Corasick automaton over the raw key bytes, spelled as latin-1 so that each
+    # byte is one character; matching yields the key bytes.
+    automaton = ahocorasick.Automaton()
+    for kb in key_bytes:
+        automaton.add_word(kb.decode("latin-1"), kb)
+    automaton.make_automaton()
+    return automaton
+
+def _present_keys(chunks: Iterable[Optional[bytes]], checked: Tuple[bytes, ...]) -> Optional[set]:
+    # The subset of `checked` occurring in any chunk, stopping once all have been seen.
+    # None if a chunk is None (undecidable).
+    present: set = set()
+    automaton = _raw_automaton(checked) if ahocorasick is not None else None
+    for chunk in chunks:
+        if chunk is None:
+            return None
+        if automaton is not None:
+            for _end, kb in automaton.iter(chunk.decode("latin-1")):
+                present.add(kb)
+                if len(present) == len(checked):
+                    return present
+        else:
+            present.update(kb for kb in checked if kb not in present and chunk.find(kb) != -1)
+            if len(present) == len(checked):
+                return present
+    return present
+
+def _shortlist_keys(buf: Union[bytes, mmap.mmap],
+                    keys: Tuple[str, ...],
+                    case_sensitive: bool) -> Tuple[str, ...]:
+    """
+    Cheap test on the raw UTF-8 file before parsing it: returns the keys that may match
+    somewhere in the file (all of them when that can't be decided), in their original order.
+    Without backslash escapes every JSON key and string value (and true/false/null)
+    appears verbatim in the raw bytes, so a key whose bytes never occur can't match.
+    The file is scanned one window at a time, so memory stays bounded by SHORTLIST_WINDOW
+    however large the (memory-mapped) file is. With pyahocorasick all keys are found in a
+    single pass; otherwise each key is a memmem scan, which is only done for a few keys.
+    """
+    key_bytes = _raw_key_bytes(keys)
+    checked = tuple(dict.fromkeys(kb for kb in key_bytes if kb is not None))
+    if (not checked or buf.find(b"\\") != -1
+            or (ahocorasick is None and len(checked) > SHORTLIST_MAX_FIND_KEYS)):
+        return keys
+    longest = max(map(len, checked))
+    if case_sensitive:
+        if ahocorasick is None:
+            chunks: Iterable[Optional[bytes]] = [buf]
+        else:
+            chunks = _raw_windows(buf, longest - 1)
     else:
-        # scalar at root
-        if not keys_only:
-            sval = scalar_to_str(obj)
-            nv = norm(sval)
-            for term in keys:
-                if term in nv:
-                    matches.append((term, path or "/"))
-    return matches
+        # A key's raw source spans at most 4 bytes per lowercased byte (KELVIN SIGN -> "k");
+        # the extra 256 bytes keep the context that final-sigma lowering looks at.
+        chunks = map(_lower_raw, _raw_windows(buf, 4 * longest + 256))
+    present = _present_keys(chunks, checked)
+    if present is None:
+        return keys
+    return tuple(k for k, kb in zip(keys, key_bytes) if kb is None or kb in present)
+
+def _search_stream(fp: str, match: Matcher, cs: bool, ko: bool, vo: bool) -> Dict[str, List[str]]:
+    # ijson picks its fastest backend (yajl2_c when built), but yajl overflows on integers
+    # past 64 bits; such files are retried once with the pure-Python backend.
+    import ijson  # optional: pip install ijson; imported on first use so other runs skip it
+    backends = [ijson]
+    if ijson.backend != "python":
+        backends.append(ijson.get_backend("python"))
+    for backend in backends:
+        try:
+            with open(fp, "rb") as f:
+                return search_json_events(backend.parse(f, use_float=True), match, cs, ko, vo, path="")
+        except ijson.JSONError:
+            if backend is backends[-1]:
+                raise
+    return {}
+
+@lru_cache(maxsize=64)
+def _cached_matcher(keys: Tuple[str, ...]) -> Matcher:
+    # Matchers are closures and don't pickle, so each worker builds its own, once per
+    # distinct per-file shortlist of keys.
+    return build_matcher(list(keys))
+
+def _scan_file(fp: str,
+               keys: Tuple[str, ...],
+               cs: bool,
+               ko: bool,
+               vo: bool,
+               stream: bool = False) -> Optional[Tuple[str, Dict[str, List[str]]]]:
+    """
+    Loads and searches a single JSON file (or stream-parses it with ijson if stream is set).
+    Returns (file, term -> [paths]) or None if the file has no matches or can't be parsed.
+    """
+    # Only load/parse failures skip a file (json.JSONDecodeError, orjson.JSONDecodeError and
+    # UnicodeDecodeError are ValueErrors; json raises RecursionError on very deep nesting).
+    # Anything raised while searching is a bug and propagates.
+    try:
+        with _file_buffer(fp) as buf:
+            keys = _shortlist_keys(buf, keys, cs)
+            if not keys:
+                return None
+            data = None if stream else _parse_buffer(buf)
+    except (OSError, ValueError, RecursionError):
+        # Skip unreadable/invalid JSON files
+        return None
+    match = _cached_matcher(keys)
+    if stream:
+        import ijson
+        try:
+            by_term = _search_stream(fp, match, cs, ko, vo)
+        except (OSError, ValueError, ijson.JSONError):
+            # Skip unreadable/invalid JSON files
+            return None
+    else:
+        by_term = search_json(data, match, cs, ko, vo, path="")
+    if not by_term:
+        return None
+    return fp, by_term
 
 def build_argparser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
@@ -130,6 +700,9 @@ def build_argparser() -> argparse.ArgumentParser:
     mode.add_argument("--values-only", action="store_true", help="Match only on values.")
     p.add_argument("--extensions", default="json", help="File extensions to scan in directories (comma-separated). Default: json")
     p.add_argument("--output", choices=["pretty", "json"], default="pretty", help="Output format. Default: pretty")
+    p.add_argument("--stream", action="store_true", help="Stream-parse files with ijson instead of loading them whole (bounded memory for huge files). "
+                        "Unlike a normal load, every copy of a duplicated object key is searched, "
+                        "and files containing NaN or Infinity are skipped (ijson rejects them).")
     return p
 
 def main():
@@ -139,6 +712,11 @@ def main():
     root = Path(args.path).expanduser().resolve()
     if not root.exists():
         ap.error(f"Path not found: {root}")
+    if args.stream:
+        try:
+            import ijson  # noqa: F401  (imported here only to check it's installed)
+        except ImportError:
+            ap.error("--stream requires the 'ijson' package (pip install ijson).")
 
     terms: List[str] = []
     if args.keys:
@@ -165,19 +743,23 @@ def main():
 
     results: Dict[str, Dict[str, List[str]]] = {}  # file -> term -> [paths]
 
-    for fp in iter_json_files(root, exts):
-        try:
-            data = json.loads(fp.read_text(encoding="utf-8"))
-        except Exception:
-            # Skip unreadable/invalid JSON files
-            continue
-        hits = search_json(data, keys, args.case_sensitive, args.keys_only, args.values_only, path="")
-        if not hits:
-            continue
-        by_term: Dict[str, List[str]] = {}
-        for term, jptr in hits:
-            by_term.setdefault(term, []).append(jptr or "/")
-        results[str(fp)] = by_term
+    # Sorted so output order doesn't depend on which directory listing finished first.
+    files = sorted(iter_json_files(root, exts))
+    scan = partial(_scan_file, keys=tuple(keys), cs=args.case_sensitive,
+                   ko=args.keys_only, vo=args.values_only, stream=args.stream)
+    if len(files) < MIN_PARALLEL_FILES:
+        scanned = list(map(scan, files))
+    else:
+        # Files are independent and traversal is CPU-bound Python, so fan out to processes.
+        # (Imported here: multiprocessing is a noticeable share of startup for small runs.)
+        from concurrent.futures import ProcessPoolExecutor
+        # About four chunks per worker: few round trips, but no worker left idle.
+        chunksize = max(1, len(files) // (4 * (os.cpu_count() or 1)))
+        with ProcessPoolExecutor() as ex:
+            scanned = list(ex.map(scan, files, chunksize=chunksize))
+    for res in scanned:
+        if res is not None:
+            results[res[0]] = res[1]
 
     # Prepare found/missing
     found_terms = set()
@@ -199,38 +781,41 @@ def main():
         print(json.dumps(out, indent=2, ensure_ascii=False))
         return
 
-    # Pretty output
-    print(f"\nSearched: {root}")
-    print(f"Keys ({'case-sensitive' if args.case_sensitive else 'case-insensitive'}): {', '.join(keys)}")
+    # Pretty output, collected in one buffer and written with a single call
+    buf = io.StringIO()
+    w = buf.write
+    w(f"\nSearched: {root}\n")
+    w(f"Keys ({'case-sensitive' if args.case_sensitive else 'case-insensitive'}): {', '.join(keys)}\n")
     if args.keys_only:
-        print("Mode: keys-only")
+        w("Mode: keys-only\n")
     elif args.values_only:
-        print("Mode: values-only")
+        w("Mode: values-only\n")
     else:
-        print("Mode: keys + values")
-    print("")
+        w("Mode: keys + values\n")
+    w("\n")
 
     if not results:
-        print("No matches found in provided files.\n")
+        w("No matches found in provided files.\n\n")
     else:
         for fpath, term_map in sorted(results.items()):
-            print(f"File: {fpath}")
+            w(f"File: {fpath}\n")
             for term in keys:
                 paths = term_map.get(term, [])
                 if paths:
-                    print(f"  {term} ✅  ({len(paths)} matches)")
+                    w(f"  {term} ✅  ({len(paths)} matches)\n")
                     for pth in paths:
-                        print(f"    - {pth}")
+                        w(f"    - {pth}\n")
                 else:
-                    print(f"  {term} —")
-            print("")
+                    w(f"  {term} —\n")
+            w("\n")
 
     if missing_terms:
-        print("Missing keys (not found anywhere):")
+        w("Missing keys (not found anywhere):\n")
         for t in missing_terms:
-            print(f"  {t} ❌")
+            w(f"  {t} ❌\n")
     else:
-        print("All keys were found at least once. 🎉")
+        w("All keys were found at least once. 🎉\n")
+    sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
     main()